@@ -1,12 +1,22 @@
 from flask import Flask, render_template, request, redirect, url_for, flash
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
 from pymongo import MongoClient
+from pymongo.errors import DuplicateKeyError
+from pymongo.write_concern import WriteConcern
 from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.middleware.proxy_fix import ProxyFix
 from datetime import datetime, timedelta
 import os
+import re
+import hashlib
 from dotenv import load_dotenv
 from bson import ObjectId
 from flask_mail import Mail, Message
+from celery import Celery, Task
+from jinja2 import FileSystemBytecodeCache
+from flask_caching import Cache
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
 
 # Load environment variables
 load_dotenv()
@@ -14,6 +24,10 @@ load_dotenv()
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'rA04CTdatnkcazOM')
 
+# Share compiled templates across worker processes (defaults to a per-user temp directory).
+# Template auto-reload is left to follow app.debug, so it stays off under gunicorn.
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(os.getenv('JINJA_CACHE_DIR'))
+
 # Mail configuration
 app.config['MAIL_SERVER'] = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
 app.config['MAIL_PORT'] = int(os.getenv('MAIL_PORT', 587))
@@ -22,34 +36,180 @@ app.config['MAIL_USERNAME'] = os.getenv('MAIL_USERNAME')
 app.config['MAIL_PASSWORD'] = os.getenv('MAIL_PASSWORD')
 app.config['MAIL_DEFAULT_SENDER'] = os.getenv('MAIL_DEFAULT_SENDER')
 
+# Password hashing cost for new accounts; stored hashes keep the method they were created with
+PASSWORD_HASH_METHOD = os.getenv('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:120000')
+
+# Keep users signed in so repeat visits don't pay for password hashing again
+app.config['REMEMBER_COOKIE_DURATION'] = timedelta(days=int(os.getenv('REMEMBER_COOKIE_DAYS', 30)))
+
+# The app runs behind a proxy (Procfile/Heroku router), so trust its X-Forwarded-For header
+# to get the real client address; set PROXY_FIX_X_FOR to the number of proxies in front
+app.wsgi_app = ProxyFix(app.wsgi_app, x_for=int(os.getenv('PROXY_FIX_X_FOR', 1)))
+
+# Rate limiting, with counters in Redis so every gunicorn worker shares them.
+# Limiting is best-effort: if the storage is unreachable requests are let through.
+app.config['RATELIMIT_STORAGE_URI'] = os.getenv('RATELIMIT_STORAGE_URI',
+                                                os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/1'))
+app.config['RATELIMIT_SWALLOW_ERRORS'] = True
+
+limiter = Limiter(get_remote_address, app=app)
+
+# Cache configuration: Redis when CACHE_REDIS_URL is set, otherwise an in-process cache
+# so local development works without a Redis server
+app.config['CACHE_REDIS_URL'] = os.getenv('CACHE_REDIS_URL')
+app.config['CACHE_TYPE'] = os.getenv('CACHE_TYPE', 'RedisCache' if app.config['CACHE_REDIS_URL'] else 'SimpleCache')
+
+cache = Cache(app)
+
 # Initialize Flask-Mail
 mail = Mail(app)
 
-def send_email(subject, recipient, template):
+# Celery configuration (emails are sent by a worker: celery -A app.celery worker -Q mail)
+app.config['CELERY_BROKER_URL'] = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+
+class FlaskTask(Task):
+    # Run every task inside the Flask app context so Flask-Mail can read its config
+    def __call__(self, *args, **kwargs):
+        with app.app_context():
+            return self.run(*args, **kwargs)
+
+celery = Celery(app.import_name, broker=app.config['CELERY_BROKER_URL'], task_cls=FlaskTask)
+celery.conf.task_routes = {'app.send_email_task': {'queue': 'mail'}}
+# Sending mail is I/O-bound, so a thread pool lets one worker keep many SMTP sessions in flight
+celery.conf.worker_pool = os.getenv('CELERY_WORKER_POOL', 'threads')
+celery.conf.worker_concurrency = int(os.getenv('CELERY_WORKER_CONCURRENCY', 16))
+
+# Email bodies, compiled once at import (autoescaped) and rendered by the worker
+EMAIL_TEMPLATES = {
+    'welcome': app.jinja_env.from_string("""
+        <h2>Welcome to the Bus Complaint System!</h2>
+        <p>Dear {{ email }},</p>
+        <p>Thank you for registering with our bus complaint management system. Your account has been successfully created.</p>
+        <p>You can now log in and submit your complaints.</p>
+        """),
+    'status_update': app.jinja_env.from_string("""
+            <h2>Complaint Status Update</h2>
+            <p>Dear {{ email }},</p>
+            <p>Your complaint has been updated:</p>
+            <ul>
+                <li>Title: {{ title }}</li>
+                <li>New Status: {{ status }}</li>
+                <li>Updated At: {{ updated_at }}</li>
+            </ul>
+            """),
+    'complaint_confirmation': app.jinja_env.from_string("""
+            <h2>Complaint Submission Confirmation</h2>
+            <p>Dear {{ email }},</p>
+            <p>Your complaint has been successfully submitted with the following details:</p>
+            <ul>
+                <li>Title: {{ title }}</li>
+                <li>Bus Route: {{ bus_route }}</li>
+                <li>Location: {{ location }}</li>
+                <li>Status: Pending</li>
+                <li>Incident Date: {{ incident_date }}</li>
+            </ul>
+            <p>We will review your complaint and take necessary action.</p>
+            """),
+}
+
+@celery.task(name='app.send_email_task', bind=True, max_retries=3, default_retry_delay=30)
+def send_email_task(self, subject, recipient, template, context):
     try:
         msg = Message(
             subject,
             recipients=[recipient],
-            html=template
+            html=EMAIL_TEMPLATES[template].render(**context)
         )
         mail.send(msg)
-        return True
     except Exception as e:
         print(f"Error sending email: {str(e)}")
+        raise self.retry(exc=e)
+
+def send_email(subject, recipient, template, **context):
+    # Queue the email so the request doesn't wait on the SMTP round-trip
+    try:
+        send_email_task.delay(subject, recipient, template, context)
+        return True
+    except Exception as e:
+        print(f"Error queueing email: {str(e)}")
         return False
 
+# Complaint writes are acknowledged by a majority of the replica set, so they survive a failover.
+# COMPLAINT_WRITE_W=1 trades that durability for lower latency (primary acknowledgement only).
+COMPLAINT_WRITE_W = os.getenv('COMPLAINT_WRITE_W', 'majority')
+COMPLAINT_WRITE_CONCERN = WriteConcern(w=int(COMPLAINT_WRITE_W) if COMPLAINT_WRITE_W.isdigit() else COMPLAINT_WRITE_W)
+
 # MongoDB setup
-client = MongoClient(os.getenv('MONGODB_URI'))
-db = client.get_database('Exsel-project')
+client = None
+db = None
+USERS = None
+COMPLAINTS = None
+
+def init_mongo():
+    # Called at import and again from gunicorn's post_fork hook, since MongoClient is not fork-safe.
+    # connect=False opens nothing until the first query, so the master never holds connections;
+    # a worker simply replaces the inherited client rather than closing it after the fork.
+    global client, db, USERS, COMPLAINTS
+    client = MongoClient(
+        os.getenv('MONGODB_URI'),
+        maxPoolSize=200,
+        minPoolSize=10,
+        maxIdleTimeMS=300000,
+        waitQueueTimeoutMS=2500,
+        retryWrites=True,
+        serverSelectionTimeoutMS=3000,
+        connect=False
+    )
+    db = client.get_database('Exsel-project')
+    # Build the Collection objects once instead of on every attribute access in the views
+    USERS = db.users
+    COMPLAINTS = db.get_collection('complaints', write_concern=COMPLAINT_WRITE_CONCERN)
+
+init_mongo()
+
+# Startup checks use a short-lived client that is closed again before gunicorn forks
+setup_client = MongoClient(os.getenv('MONGODB_URI'), serverSelectionTimeoutMS=3000)
 
 # Verify database connection
 try:
     # The ismaster command is cheap and does not require auth
-    client.admin.command('ismaster')
+    setup_client.admin.command('ismaster')
     print('MongoDB connection successful')
 except Exception as e:
     print(f'MongoDB connection failed: {e}')
 
+# Registration relies on the unique email index to reject duplicates; if it could not be
+# built (e.g. existing duplicate emails), register falls back to checking before inserting
+UNIQUE_EMAIL_INDEX = False
+
+def ensure_indexes(database):
+    # A student's own complaints, newest first
+    database.complaints.create_index([('user_id', 1), ('created_at', -1)], background=True)
+    # Newest-first ordering of the admin tables
+    database.complaints.create_index([('created_at', -1)], background=True)
+    database.users.create_index([('role', 1), ('created_at', -1)], background=True)
+    # Matches the duplicate check: bus_route equality plus an incident_date range, with the
+    # fingerprint as a trailing key
+    database.complaints.create_index([('bus_route', 1), ('incident_date', 1), ('description_fp', 1)], background=True)
+
+def ensure_unique_email_index(database):
+    global UNIQUE_EMAIL_INDEX
+    database.users.create_index('email', unique=True, background=True)
+    UNIQUE_EMAIL_INDEX = True
+
+try:
+    ensure_indexes(setup_client.get_database('Exsel-project'))
+except Exception as e:
+    print(f'MongoDB index creation failed: {e}')
+
+# Built separately so existing duplicate emails can't stop the other indexes from being created
+try:
+    ensure_unique_email_index(setup_client.get_database('Exsel-project'))
+except Exception as e:
+    print(f'MongoDB unique email index creation failed: {e}')
+
+setup_client.close()
+
 # Login manager setup
 login_manager = LoginManager()
 login_manager.init_app(app)
@@ -62,11 +222,68 @@ class User(UserMixin):
     def get_id(self):
         return str(self.user_data['_id'])
 
+@cache.memoize(timeout=300)
+def get_user_data(user_id):
+    # Loaded on every authenticated request, so cache it; the password hash is never needed here
+    return USERS.find_one({'_id': ObjectId(user_id)}, {'password': 0})
+
 @login_manager.user_loader
 def load_user(user_id):
-    user_data = db.users.find_one({'_id': ObjectId(user_id)})
+    user_data = get_user_data(user_id)
     return User(user_data) if user_data else None
 
+def description_fingerprint(description):
+    # Case- and whitespace-insensitive key for spotting identical descriptions
+    return hashlib.sha1(' '.join(description.lower().split()).encode()).digest()
+
+def find_duplicate_complaint(bus_route, incident_date, description):
+    next_day = incident_date + timedelta(days=1)
+    description_lower = description.lower()
+
+    # A complaint is a duplicate if it has the same normalized description, or if either
+    # description contains the other (case-insensitive). One query: the route/day index prefix
+    # bounds the scan and the server stops at the first match
+    return COMPLAINTS.find_one({
+        'bus_route': bus_route,
+        'incident_date': {'$gte': incident_date, '$lt': next_day},
+        '$or': [
+            {'description_fp': description_fingerprint(description)},
+            {'description': {'$regex': re.escape(description), '$options': 'i'}},
+            {'$expr': {'$gte': [
+                {'$indexOfCP': [
+                    # $literal keeps user text starting with '$' from being read as a field path
+                    {'$literal': description_lower},
+                    {'$ifNull': ['$description_lower', {'$toLower': '$description'}]}
+                ]},
+                0
+            ]}}
+        ]
+    }, {'_id': 1})
+
+ADMIN_PAGE_SIZE = 100
+DASHBOARD_PAGE_SIZE = 50
+
+# Only the fields the dashboard tables render
+DASHBOARD_COMPLAINT_FIELDS = {
+    'student_id': 1, 'bus_route': 1, 'title': 1, 'description': 1,
+    'location': 1, 'status': 1, 'incident_date': 1, 'created_at': 1
+}
+ADMIN_COMPLAINT_FIELDS = {
+    'title': 1, 'description': 1, 'bus_route': 1,
+    'location': 1, 'status': 1, 'created_at': 1
+}
+
+@cache.memoize(timeout=30)
+def admin_stats():
+    counts = {row['_id']: row['n'] for row in COMPLAINTS.aggregate([
+        {'$group': {'_id': '$status', 'n': {'$sum': 1}}}
+    ])}
+    return {
+        'total_complaints': sum(counts.values()),
+        'pending_complaints': counts.get('pending', 0),
+        'resolved_complaints': counts.get('resolved', 0)
+    }
+
 # Routes
 @app.route('/')
 def home():
@@ -79,11 +296,11 @@ def register():
         password = request.form.get('password')
         role = request.form.get('role')
         
-        if db.users.find_one({'email': email}):
+        if not UNIQUE_EMAIL_INDEX and USERS.find_one({'email': email}, {'_id': 1}):
             flash('Email already exists')
             return redirect(url_for('register'))
         
-        hashed_password = generate_password_hash(password)
+        hashed_password = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
         user_data = {
             'email': email,
             'password': hashed_password,
@@ -91,17 +308,14 @@ def register():
             'created_at': datetime.utcnow()
         }
         
-        db.users.insert_one(user_data)
+        try:
+            USERS.insert_one(user_data)
+        except DuplicateKeyError:
+            flash('Email already exists')
+            return redirect(url_for('register'))
         
         # Send welcome email
-        welcome_template = f"""
-        <h2>Welcome to the Bus Complaint System!</h2>
-        <p>Dear {email},</p>
-        <p>Thank you for registering with our bus complaint management system. Your account has been successfully created.</p>
-        <p>You can now log in and submit your complaints.</p>
-        """
-        
-        if send_email('Welcome to Bus Complaint System', email, welcome_template):
+        if send_email('Welcome to Bus Complaint System', email, 'welcome', email=email):
             flash('Registration successful. Welcome email sent!')
         else:
             flash('Registration successful, but welcome email could not be sent.')
@@ -109,16 +323,22 @@ def register():
     
     return render_template('register.html')
 
+def login_rate_limit_key():
+    # Per address and account, so one mistyped password behind a campus NAT doesn't lock out everyone
+    return f"{get_remote_address()}:{request.form.get('email', '').strip().lower()}"
+
 @app.route('/login', methods=['GET', 'POST'])
+@limiter.limit('5/minute', methods=['POST'], key_func=login_rate_limit_key)
+@limiter.limit('50/minute', methods=['POST'])
 def login():
     if request.method == 'POST':
         email = request.form.get('email')
         password = request.form.get('password')
         
-        user_data = db.users.find_one({'email': email})
+        user_data = USERS.find_one({'email': email}, {'password': 1, 'role': 1, '_id': 1})
         if user_data and check_password_hash(user_data['password'], password):
             user = User(user_data)
-            login_user(user)
+            login_user(user, remember=True)
             
             if user_data['role'] == 'admin':
                 return redirect(url_for('admin_dashboard'))
@@ -130,6 +350,7 @@ def login():
 @app.route('/logout')
 @login_required
 def logout():
+    cache.delete_memoized(get_user_data, current_user.get_id())
     logout_user()
     return redirect(url_for('home'))
 
@@ -139,8 +360,20 @@ def dashboard():
     if current_user.user_data['role'] == 'admin':
         return redirect(url_for('admin_dashboard'))
     
-    user_complaints = list(db.complaints.find({'user_id': str(current_user.user_data['_id'])}))
-    return render_template('dashboard.html', complaints=user_complaints)
+    page = max(request.args.get('page', 1, type=int), 1)
+    # Jinja iterates the cursor directly, so only one page of complaints is ever decoded;
+    # the one extra row only tells the template whether an older page exists
+    user_complaints = (COMPLAINTS.find(
+        {'user_id': str(current_user.user_data['_id'])},
+        DASHBOARD_COMPLAINT_FIELDS
+    )
+        .sort('created_at', -1)
+        .skip((page - 1) * DASHBOARD_PAGE_SIZE)
+        .limit(DASHBOARD_PAGE_SIZE + 1))
+    return render_template('dashboard.html',
+                          complaints=user_complaints,
+                          page=page,
+                          page_size=DASHBOARD_PAGE_SIZE)
 
 @app.route('/update-complaint-status/<complaint_id>/<status>')
 @login_required
@@ -149,28 +382,27 @@ def update_complaint_status(complaint_id, status):
         flash('Unauthorized access')
         return redirect(url_for('dashboard'))
     
-    complaint = db.complaints.find_one_and_update(
+    now = datetime.utcnow()
+    complaint = COMPLAINTS.find_one_and_update(
         {'_id': ObjectId(complaint_id)},
-        {'$set': {'status': status, 'updated_at': datetime.utcnow()}},
+        {'$set': {'status': status, 'updated_at': now}},
         return_document=True
     )
     
     if complaint:
-        user = db.users.find_one({'_id': ObjectId(complaint['user_id'])})
-        if user:
+        cache.delete_memoized(admin_stats)
+        # New complaints carry the owner's email; older ones still need the users lookup
+        user_email = complaint.get('user_email')
+        if not user_email:
+            user = USERS.find_one({'_id': ObjectId(complaint['user_id'])})
+            user_email = user['email'] if user else None
+        if user_email:
             # Send status update email
-            update_template = f"""
-            <h2>Complaint Status Update</h2>
-            <p>Dear {user['email']},</p>
-            <p>Your complaint has been updated:</p>
-            <ul>
-                <li>Title: {complaint['title']}</li>
-                <li>New Status: {status}</li>
-                <li>Updated At: {datetime.utcnow().strftime('%Y-%m-%d %H:%M')}</li>
-            </ul>
-            """
-            
-            if send_email('Complaint Status Update', user['email'], update_template):
+            if send_email('Complaint Status Update', user_email, 'status_update',
+                          email=user_email,
+                          title=complaint['title'],
+                          status=status,
+                          updated_at=now.strftime('%Y-%m-%d %H:%M')):
                 flash('Complaint status updated successfully. Notification email sent!')
             else:
                 flash('Complaint status updated successfully, but notification email could not be sent.')
@@ -183,20 +415,28 @@ def admin_dashboard():
     if current_user.user_data['role'] != 'admin':
         return redirect(url_for('dashboard'))
     
-    complaints = list(db.complaints.find())
-    users = list(db.users.find({'role': 'student'}))
+    page = max(request.args.get('page', 1, type=int), 1)
+    user_page = max(request.args.get('user_page', 1, type=int), 1)
+    stats = admin_stats()
     
-    # Calculate statistics
-    total_complaints = len(complaints)
-    pending_complaints = sum(1 for c in complaints if c['status'] == 'pending')
-    resolved_complaints = sum(1 for c in complaints if c['status'] == 'resolved')
+    complaints = list(COMPLAINTS.find({}, ADMIN_COMPLAINT_FIELDS)
+                      .sort('created_at', -1)
+                      .skip((page - 1) * ADMIN_PAGE_SIZE)
+                      .limit(ADMIN_PAGE_SIZE))
+    users = list(USERS.find({'role': 'student'}, {'email': 1, 'created_at': 1})
+                 .sort('created_at', -1)
+                 .skip((user_page - 1) * ADMIN_PAGE_SIZE)
+                 .limit(ADMIN_PAGE_SIZE + 1))
+    has_more_users = len(users) > ADMIN_PAGE_SIZE
     
     return render_template('admin_dashboard.html',
                           complaints=complaints,
-                          users=users,
-                          total_complaints=total_complaints,
-                          pending_complaints=pending_complaints,
-                          resolved_complaints=resolved_complaints)
+                          users=users[:ADMIN_PAGE_SIZE],
+                          page=page,
+                          user_page=user_page,
+                          has_more_complaints=page * ADMIN_PAGE_SIZE < stats['total_complaints'],
+                          has_more_users=has_more_users,
+                          **stats)
 
 @app.route('/submit-complaint', methods=['GET', 'POST'])
 @login_required
@@ -218,52 +458,40 @@ def submit_complaint():
         try:
             # Convert incident_date string to datetime
             incident_date = datetime.strptime(incident_date, '%Y-%m-%d')
-            next_day = incident_date + timedelta(days=1)
             
             # Check for duplicate complaints
-            existing_complaints = db.complaints.find({
-                'bus_route': bus_route,
-                'incident_date': {'$gte': incident_date, '$lt': next_day}
-            })
-            
-            for complaint in existing_complaints:
-                existing_description = complaint.get('description', '').lower()
-                if description.lower() in existing_description or existing_description in description.lower():
-                    flash('A similar complaint has already been submitted for this bus on the selected date.', 'warning')
-                    return redirect(url_for('submit_complaint'))
+            if find_duplicate_complaint(bus_route, incident_date, description):
+                flash('A similar complaint has already been submitted for this bus on the selected date.', 'warning')
+                return redirect(url_for('submit_complaint'))
             
             # If no duplicate found, create new complaint
+            now = datetime.utcnow()
             complaint_data = {
                 'user_id': str(current_user.user_data['_id']),
+                'user_email': current_user.user_data['email'],
                 'student_id': student_id,
                 'bus_route': bus_route,
                 'title': title,
                 'description': description,
+                'description_lower': description.lower(),
+                'description_fp': description_fingerprint(description),
                 'location': location,
                 'status': 'pending',
-                'created_at': datetime.utcnow(),
-                'updated_at': datetime.utcnow(),
+                'created_at': now,
+                'updated_at': now,
                 'incident_date': incident_date
             }
             
-            result = db.complaints.insert_one(complaint_data)
+            result = COMPLAINTS.insert_one(complaint_data)
+            cache.delete_memoized(admin_stats)
             
             # Send confirmation email to user
-            complaint_template = f"""
-            <h2>Complaint Submission Confirmation</h2>
-            <p>Dear {current_user.user_data['email']},</p>
-            <p>Your complaint has been successfully submitted with the following details:</p>
-            <ul>
-                <li>Title: {title}</li>
-                <li>Bus Route: {bus_route}</li>
-                <li>Location: {location}</li>
-                <li>Status: Pending</li>
-                <li>Incident Date: {incident_date.strftime('%Y-%m-%d')}</li>
-            </ul>
-            <p>We will review your complaint and take necessary action.</p>
-            """
-            
-            if send_email('Complaint Submission Confirmation', current_user.user_data['email'], complaint_template):
+            if send_email('Complaint Submission Confirmation', current_user.user_data['email'], 'complaint_confirmation',
+                          email=current_user.user_data['email'],
+                          title=title,
+                          bus_route=bus_route,
+                          location=location,
+                          incident_date=incident_date.strftime('%Y-%m-%d')):
                 flash('Complaint submitted successfully. Confirmation email sent!', 'success')
             else:
                 flash('Complaint submitted successfully, but confirmation email could not be sent.', 'warning')
@@ -280,27 +508,40 @@ def submit_complaint():
 
 @app.route('/check_duplicate_complaint', methods=['POST'])
 @login_required
+@limiter.limit('10/minute', key_func=lambda: current_user.get_id())
 def check_duplicate_complaint():
     data = request.get_json()
     bus_route = data.get('bus_route')
-    description = data.get('description')
+    description = data.get('description') or ''
     incident_date_str = data.get('incident_date')
 
+    # Too short to be meaningful; the full check still runs when the form is submitted
+    if len(description) < 8:
+        return {'duplicate': False}, 200
+
     try:
         # Convert string date to datetime object
         incident_date = datetime.strptime(incident_date_str, '%Y-%m-%d')
-        next_day = incident_date + timedelta(days=1)
 
-        # Search for similar complaints on the same route and day
-        existing_complaints = db.complaints.find({
-            'bus_route': bus_route,
-            'incident_date': {'$gte': incident_date, '$lt': next_day}
-        })
+        # Repeated checks for the same input within 30 seconds are answered from the cache
+        cache_key = 'duplicate_check:{}:{}:{}:{}'.format(
+            current_user.get_id(), bus_route, incident_date_str, description_fingerprint(description).hex()
+        )
+        try:
+            duplicate = cache.get(cache_key)
+        except Exception as e:
+            print(f'Duplicate check cache unavailable: {e}')
+            duplicate = None
+        if duplicate is None:
+            # Search for similar complaints on the same route and day
+            duplicate = find_duplicate_complaint(bus_route, incident_date, description) is not None
+            try:
+                cache.set(cache_key, duplicate, timeout=30)
+            except Exception as e:
+                print(f'Duplicate check cache unavailable: {e}')
 
-        for complaint in existing_complaints:
-            existing_description = complaint.get('description', '').lower()
-            if description.lower() in existing_description or existing_description in description.lower():
-                return {'duplicate': True, 'message': 'A similar complaint has already been submitted.'}, 200
+        if duplicate:
+            return {'duplicate': True, 'message': 'A similar complaint has already been submitted.'}, 200
 
         return {'duplicate': False}, 200
 
@@ -309,4 +550,5 @@ def check_duplicate_complaint():
 
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py)
+    app.run(debug=os.getenv('FLASK_DEBUG', '1') == '1')
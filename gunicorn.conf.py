@@ -0,0 +1,14 @@
+import multiprocessing
+import os
+
+# Threaded workers suit this app: requests mostly wait on MongoDB and the mail broker
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+preload_app = True
+
+
+def post_fork(server, worker):
+    # Give each worker a fresh MongoDB client instead of the one inherited from the master
+    import app
+    app.init_mongo()